@@ -0,0 +1,192 @@
+import contextlib
+import mmap
+import os
+import re
+import stat
+from pathlib import Path
+
+
+def replace_all(content, replacements, limits=None):
+    """Apply every old -> new pair in one scan of content.
+
+    Keys are tried longest first so a key that is a prefix of another never
+    shadows it. limits optionally caps how many times a key is replaced, like
+    the count argument of str.replace. A single pair is handed straight to
+    str.replace, which is already one pass and skips compiling the key.
+    """
+    if not replacements:
+        return content
+    if len(replacements) == 1:
+        ((old, new),) = replacements.items()
+        return content.replace(old, new, (limits or {}).get(old, -1))
+
+    remaining = dict(limits or {})
+    pattern = re.compile(
+        "|".join(re.escape(old) for old in sorted(replacements, key=len, reverse=True))
+    )
+
+    def substitute(match):
+        old = match.group(0)
+        if old in remaining:
+            if remaining[old] == 0:
+                return old
+            remaining[old] -= 1
+        return replacements[old]
+
+    return pattern.sub(substitute, content)
+
+
+def replace_between(content, start_marker, end_marker, new):
+    """Replace the first block running from start_marker through end_marker.
+
+    Content is returned unchanged when either marker is missing.
+    """
+    start = content.find(start_marker)
+    if start == -1:
+        return content
+    end = content.find(end_marker, start + len(start_marker))
+    if end == -1:
+        return content
+    return content[:start] + new + content[end + len(end_marker):]
+
+
+def write_atomic(path, content):
+    """Write content to a sibling temp file, then os.replace it over path.
+
+    A crash mid-write leaves the original file intact instead of a truncated
+    Rust source. The temp file takes path's permissions and is removed if
+    the write or replace fails.
+    """
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_text(content)
+        tmp.chmod(stat.S_IMODE(path.stat().st_mode))
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def find_anchored(buf, pattern, anchor):
+    """Yield the non-overlapping matches of pattern that start with anchor.
+
+    bytes.find jumps between occurrences of the literal anchor, which is far
+    faster than the regex engine scanning byte by byte, and pattern.match
+    runs only at those offsets. Same result as pattern.finditer(buf) when
+    every match begins with anchor.
+    """
+    pos = buf.find(anchor)
+    while pos != -1:
+        match = pattern.match(buf, pos)
+        if match:
+            yield match
+            pos = buf.find(anchor, max(match.end(), pos + 1))
+        else:
+            pos = buf.find(anchor, pos + 1)
+
+
+def sub_anchored(buf, pattern, anchor, substitute):
+    """Like pattern.sub(substitute, buf), with the scan done by find_anchored."""
+    parts = []
+    last = 0
+    for match in find_anchored(buf, pattern, anchor):
+        parts.append(buf[last:match.start()])
+        parts.append(substitute(match))
+        last = match.end()
+    if not parts:
+        return buf
+    parts.append(buf[last:])
+    return buf[:0].join(parts)
+
+
+def patch_mapped(path, pattern, substitute, anchor=None):
+    """Replace every match of a bytes pattern in path, reading through mmap.
+
+    The file is mapped read-only and scanned once, through find_anchored
+    when a literal anchor prefix is given; substitute(match) gives the
+    replacement bytes for each hit. The new file is written with one
+    gathered os.writev of memoryview slices over the mapping interleaved
+    with the replacements, so unchanged regions are never copied into a
+    Python object. It goes to a sibling temp file with path's permissions
+    that is renamed over path, so a crash leaves the original intact and a
+    failed write leaves no temp file behind. Returns whether anything
+    changed.
+    """
+    path = Path(path)
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        st = os.fstat(fd)
+        if st.st_size == 0:
+            return False
+        with contextlib.ExitStack() as stack:
+            mm = stack.enter_context(mmap.mmap(fd, 0, prot=mmap.PROT_READ))
+            view = stack.enter_context(memoryview(mm))
+            chunks = []
+            # Exported slices keep the mapping open. The stack unwinds in
+            # reverse, so they are released before the view and the mapping
+            # close, even when the scan, substitute or the write raises.
+            stack.callback(_release_all, chunks)
+            last = 0
+            matches = find_anchored(mm, pattern, anchor) if anchor else _search_all(mm, pattern)
+            for match in matches:
+                chunks.append(view[last:match.start()])
+                chunks.append(memoryview(substitute(match)))
+                last = match.end()
+            if not chunks:
+                return False
+            chunks.append(view[last:])
+            tmp = path.with_name(path.name + ".tmp")
+            _write_gathered(tmp, chunks, stat.S_IMODE(st.st_mode))
+    finally:
+        os.close(fd)
+    try:
+        os.rename(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def _search_all(buf, pattern):
+    """Yield the non-overlapping matches of pattern in buf, like finditer.
+
+    finditer's scanner holds a buffer export on buf for as long as it is
+    alive, which would keep an mmap from closing if the caller raises
+    mid-iteration. Each pattern.search call releases its export on return.
+    """
+    match = pattern.search(buf)
+    while match:
+        yield match
+        pos = match.end() if match.end() > match.start() else match.end() + 1
+        match = pattern.search(buf, pos)
+
+
+def _release_all(views):
+    for view in views:
+        view.release()
+
+
+def _write_gathered(path, chunks, mode):
+    """Write chunks to a new file at path with os.writev.
+
+    Partial writes are resumed. The file gets exactly the given permission
+    bits, regardless of umask, and is removed again if writing fails.
+    """
+    iov_max = os.sysconf("SC_IOV_MAX") if "SC_IOV_MAX" in os.sysconf_names else 1024
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        os.fchmod(fd, mode)
+        first = 0
+        while first < len(chunks):
+            written = os.writev(fd, chunks[first:first + iov_max])
+            while first < len(chunks) and written >= len(chunks[first]):
+                written -= len(chunks[first])
+                first += 1
+            if written:
+                chunks[first] = chunks[first][written:]
+    except BaseException:
+        os.close(fd)
+        os.unlink(path)
+        raise
+    os.close(fd)
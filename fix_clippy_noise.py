@@ -1,5 +1,7 @@
 import os
-import re
+from pathlib import Path
+
+from codemod import write_atomic
 
 attr_file = "#![allow(clippy::unwrap_used, clippy::expect_used, clippy::panic, clippy::float_cmp)]\n"
 attr_block = "#[allow(clippy::unwrap_used, clippy::expect_used, clippy::panic, clippy::float_cmp)]\n"
@@ -9,8 +11,7 @@ def process_tests_dir():
     for filename in os.listdir(tests_dir):
         if filename.endswith(".rs"):
             filepath = os.path.join(tests_dir, filename)
-            with open(filepath, "r") as f:
-                content = f.read()
+            content = Path(filepath).read_text()
             
             if attr_file in content:
                 continue
@@ -27,8 +28,7 @@ def process_tests_dir():
                     break
             
             lines.insert(insert_idx, attr_file)
-            with open(filepath, "w") as f:
-                f.writelines(lines)
+            write_atomic(filepath, "".join(lines))
             print(f"Updated {filepath}")
 
 def process_mod_tests():
@@ -37,14 +37,12 @@ def process_mod_tests():
         for filename in files:
             if filename.endswith(".rs"):
                 filepath = os.path.join(root, filename)
-                with open(filepath, "r") as f:
-                    content = f.read()
+                content = Path(filepath).read_text()
                 
                 # Check for inline mod tests {
                 if "mod tests {" in content and attr_block not in content:
                     content = content.replace("mod tests {", attr_block + "mod tests {")
-                    with open(filepath, "w") as f:
-                        f.write(content)
+                    write_atomic(filepath, content)
                     print(f"Updated {filepath} (inline)")
                 
                 # Check for out-of-line mod tests;
@@ -59,14 +57,12 @@ def process_mod_tests():
                         potential_test_file = os.path.join(parent_dir, filename[:-3], "tests.rs")
                     
                     if os.path.exists(potential_test_file):
-                        with open(potential_test_file, "r") as f:
-                            test_content = f.read()
+                        test_content = Path(potential_test_file).read_text()
                         
                         if attr_file not in test_content:
                             test_lines = test_content.splitlines(keepends=True)
                             test_lines.insert(0, attr_file)
-                            with open(potential_test_file, "w") as f:
-                                f.writelines(test_lines)
+                            write_atomic(potential_test_file, "".join(test_lines))
                             print(f"Updated {potential_test_file} (out-of-line)")
 
 if __name__ == "__main__":
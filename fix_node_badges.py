@@ -1,9 +1,8 @@
-import re
+from pathlib import Path
 
-content = open("src/ui/node.rs").read()
+from codemod import replace_all, write_atomic
 
-content = content.replace("let (bg_color, text_color, border_color, icon_name, is_spin) =", "let tuple =")
-content = content.replace("                                }", "                                }") # Ensure spacing
+TARGET = "src/ui/node.rs"
 
 old_rsx = """                            rsx! {
                                 span {
@@ -27,7 +26,18 @@ new_rsx = """                            let bg_color = tuple.0;
                                 }
                             }"""
 
-content = content.replace(old_rsx, new_rsx)
 
-with open("src/ui/node.rs", "w") as f:
-    f.write(content)
+def rewrite(content):
+    content = replace_all(content, {
+        "let (bg_color, text_color, border_color, icon_name, is_spin) =": "let tuple =",
+        old_rsx: new_rsx,
+    })
+    return content
+
+
+def run():
+    write_atomic(TARGET, rewrite(Path(TARGET).read_text()))
+
+
+if __name__ == "__main__":
+    run()
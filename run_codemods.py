@@ -0,0 +1,50 @@
+"""Run the codemod scripts, one worker per target file.
+
+Scripts that touch the same file are chained in a single worker so the file
+is read once, rewritten in order, and written once. Different files have no
+shared state, so their groups run in parallel.
+"""
+
+import importlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from codemod import write_atomic
+
+# Order within a group matters: fix_node_badges rewrites text that
+# update_node_badges introduces. update_sidebar* target src/ui/sidebar.rs,
+# which no longer exists, and update_edges makes no changes, so they are
+# left out.
+GROUPS = [
+    ["update_main_full"],
+    ["update_mod_full", "update_metadata"],
+    ["update_node_badges", "fix_node_badges", "update_ui_node"],
+]
+
+
+def run_group(names):
+    modules = [importlib.import_module(name) for name in names]
+    target = modules[0].TARGET
+    assert all(m.TARGET == target for m in modules), names
+    original = Path(target).read_text()
+    content = original
+    for module in modules:
+        if getattr(module, "BINARY", False):
+            content = module.rewrite(content.encode()).decode()
+        else:
+            content = module.rewrite(content)
+    if content == original:
+        return None
+    write_atomic(target, content)
+    return target
+
+
+def main():
+    with ProcessPoolExecutor() as executor:
+        for target in executor.map(run_group, GROUPS):
+            if target is not None:
+                print(f"rewrote {target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 use crate::graph::{NodeId, Workflow};
-use petgraph::algo::toposort;
-use petgraph::graph::NodeIndex;
-use petgraph::Graph;
-use std::collections::HashMap;
+use rustc_hash::{FxBuildHasher, FxHashMap};
+use std::cell::RefCell;
+use std::collections::VecDeque;
+use std::hash::{DefaultHasher, Hash, Hasher};
 
 /// Visual width of a flow node in pixels.
 const NODE_WIDTH: f32 = 220.0;
@@ -10,206 +10,506 @@ const NODE_WIDTH: f32 = 220.0;
 /// Visual height of a flow node in pixels.
 const NODE_HEIGHT: f32 = 68.0;
 
+/// Layout coordinates keyed by the structure hash they were computed for.
+type CachedLayout = (u64, Vec<(f32, f32)>);
+
 pub struct DagLayout {
     pub layer_spacing: f32,
     pub node_spacing: f32,
+    /// Upper bound on crossing-minimization sweeps. Sweeping stops earlier
+    /// once a sweep fails to reduce the edge crossing count.
+    pub max_sweeps: u8,
+    /// Coordinates from the last successful layout. The result depends only
+    /// on node ids, connections, spacing and `max_sweeps`, so an unchanged
+    /// structure (for example when only `config` or status fields changed)
+    /// is replayed instead of recomputed.
+    cache: RefCell<Option<CachedLayout>>,
 }
 
 impl Default for DagLayout {
     fn default() -> Self {
-        Self {
-            layer_spacing: 140.0,
-            node_spacing: 60.0,
-        }
+        Self::new(140.0, 60.0)
     }
 }
 
 const LEFT_PADDING: f32 = 120.0;
 const TOP_PADDING: f32 = 80.0;
 
+#[derive(Clone, Copy)]
+enum Direction {
+    Incoming,
+    Outgoing,
+}
+
+/// Compressed sparse row adjacency: the neighbors of node `v` are
+/// `neighbors[offsets[v]..offsets[v + 1]]`, in edge order.
+struct Csr {
+    offsets: Vec<u32>,
+    neighbors: Vec<u32>,
+}
+
+impl Csr {
+    /// Two-pass counting-sort construction from `(from, to)` pairs.
+    fn from_edges(node_count: usize, edges: impl Iterator<Item = (u32, u32)> + Clone) -> Self {
+        let mut offsets: Vec<u32> = vec![0; node_count + 1];
+        for (from, _) in edges.clone() {
+            offsets[from as usize] += 1;
+        }
+        let mut running = 0;
+        for slot in &mut offsets {
+            let count = *slot;
+            *slot = running;
+            running += count;
+        }
+
+        let mut cursor = offsets[..node_count].to_vec();
+        let mut neighbors: Vec<u32> = vec![0; running as usize];
+        for (from, to) in edges {
+            let next = &mut cursor[from as usize];
+            neighbors[*next as usize] = to;
+            *next += 1;
+        }
+
+        Self { offsets, neighbors }
+    }
+
+    fn neighbors(&self, node: u32) -> &[u32] {
+        let node = node as usize;
+        &self.neighbors[self.offsets[node] as usize..self.offsets[node + 1] as usize]
+    }
+}
+
+/// Read-only view of the workflow DAG used by the layout passes.
+///
+/// Node `i` is `workflow.nodes[i]`; connections whose endpoints are not in
+/// the workflow are dropped.
+struct LayoutGraph {
+    incoming: Csr,
+    outgoing: Csr,
+}
+
+impl LayoutGraph {
+    #[allow(clippy::cast_possible_truncation)]
+    fn from_workflow(workflow: &Workflow) -> Self {
+        let node_count = workflow.nodes.len();
+        let mut id_to_idx: FxHashMap<NodeId, u32> =
+            FxHashMap::with_capacity_and_hasher(node_count, FxBuildHasher);
+        for (idx, node) in workflow.nodes.iter().enumerate() {
+            id_to_idx.insert(node.id, idx as u32);
+        }
+
+        let edges: Vec<(u32, u32)> = workflow
+            .connections
+            .iter()
+            .filter_map(|conn| Some((*id_to_idx.get(&conn.source)?, *id_to_idx.get(&conn.target)?)))
+            .collect();
+
+        Self {
+            incoming: Csr::from_edges(node_count, edges.iter().map(|&(src, tgt)| (tgt, src))),
+            outgoing: Csr::from_edges(node_count, edges.iter().copied()),
+        }
+    }
+
+    const fn node_count(&self) -> usize {
+        self.outgoing.offsets.len() - 1
+    }
+
+    fn neighbors(&self, node: u32, direction: Direction) -> &[u32] {
+        match direction {
+            Direction::Incoming => self.incoming.neighbors(node),
+            Direction::Outgoing => self.outgoing.neighbors(node),
+        }
+    }
+}
+
+/// Longest-path layering computed in a single Kahn traversal.
+///
+/// In-degrees live in a dense array indexed by node. Each node's layer is
+/// final by the time it is dequeued, so it is appended to its layer on
+/// emission and layers come out in deterministic topological order.
+///
+/// Returns the per-node layer array alongside the grouped layers, or `None`
+/// when the graph contains a cycle.
+#[allow(clippy::cast_possible_truncation)]
+fn assign_layers(graph: &LayoutGraph) -> Option<(Vec<u32>, Vec<Vec<u32>>)> {
+    let node_count = graph.node_count();
+    let mut in_degree: Vec<u32> = (0..node_count as u32)
+        .map(|node| graph.neighbors(node, Direction::Incoming).len() as u32)
+        .collect();
+
+    let mut layer: Vec<u32> = vec![0; node_count];
+    let mut queue: VecDeque<u32> = (0..node_count as u32)
+        .filter(|&node| in_degree[node as usize] == 0)
+        .collect();
+    let mut nodes_by_layer: Vec<Vec<u32>> = Vec::new();
+    let mut emitted = 0_usize;
+
+    while let Some(node) = queue.pop_front() {
+        emitted += 1;
+        let node_layer = layer[node as usize];
+        let slot = node_layer as usize;
+        if nodes_by_layer.len() <= slot {
+            nodes_by_layer.resize_with(slot + 1, Vec::new);
+        }
+        nodes_by_layer[slot].push(node);
+
+        for &child in graph.neighbors(node, Direction::Outgoing) {
+            let child_slot = child as usize;
+            layer[child_slot] = layer[child_slot].max(node_layer + 1);
+            in_degree[child_slot] -= 1;
+            if in_degree[child_slot] == 0 {
+                queue.push_back(child);
+            }
+        }
+    }
+
+    (emitted == node_count).then_some((layer, nodes_by_layer))
+}
+
+/// Weighted median of sorted neighbor positions, as used by Graphviz `dot`.
+///
+/// With an even number of neighbors the two middle positions are
+/// interpolated towards the side whose neighbors are packed more tightly.
+/// Returns `None` when there are no neighbors.
+#[allow(clippy::cast_precision_loss)]
+fn weighted_median(positions: &[u32]) -> Option<f32> {
+    let len = positions.len();
+    let mid = len / 2;
+    match len {
+        0 => None,
+        _ if len % 2 == 1 => Some(positions[mid] as f32),
+        2 => Some(f32::midpoint(positions[0] as f32, positions[1] as f32)),
+        _ => {
+            let left = positions[mid - 1] - positions[0];
+            let right = positions[len - 1] - positions[mid];
+            let (lower, upper) = (positions[mid - 1] as f32, positions[mid] as f32);
+            if left + right == 0 {
+                Some(f32::midpoint(lower, upper))
+            } else {
+                let (left, right) = (left as f32, right as f32);
+                Some(lower.mul_add(right, upper * left) / (left + right))
+            }
+        }
+    }
+}
+
+/// Counts crossings between two adjacent layers with the accumulator tree of
+/// Barth, Jünger and Mutzel.
+///
+/// `south` lists the lower-layer rank of every edge, ordered by upper-layer
+/// rank and then lower-layer rank; two edges cross exactly when they form an
+/// inversion in that sequence. `tree` is scratch space reused across calls.
+fn bilayer_crossings(south: &[u32], south_width: usize, tree: &mut Vec<u32>) -> u64 {
+    let mut first_leaf = 1;
+    while first_leaf < south_width {
+        first_leaf *= 2;
+    }
+    // One spare slot past the last leaf keeps `tree[index + 1]` in bounds
+    // for every index, so right siblings are added without a branch.
+    tree.clear();
+    tree.resize(2 * first_leaf, 0);
+    let first_leaf = first_leaf - 1;
+
+    let mut crossings = 0;
+    for &pos in south {
+        let mut index = pos as usize + first_leaf;
+        tree[index] += 1;
+        while index > 0 {
+            // Left children have odd indices; their right sibling's edges
+            // all end further right, so each of them crosses this edge.
+            crossings += u64::from(tree[index + 1]) * (index as u64 & 1);
+            index = (index - 1) / 2;
+            tree[index] += 1;
+        }
+    }
+    crossings
+}
+
+/// Maps an `f32` to a `u32` whose unsigned order matches `f32::total_cmp`,
+/// so sort keys compare as plain integers.
+const fn ordered_bits(value: f32) -> u32 {
+    let bits = value.to_bits();
+    if bits >> 31 == 1 {
+        !bits
+    } else {
+        bits | 0x8000_0000
+    }
+}
+
+/// Crossing-minimization sweep state, allocated once per layout call.
+///
+/// `rank` holds each node's position within its layer and is refreshed for
+/// the fixed layer before each layer is reordered, so neighbor positions are
+/// O(1) array reads. `neighbor_ranks` collects the sorted fixed-layer ranks
+/// of every node in the layer being ordered, delimited by `spans`; they feed
+/// both the median keys and the crossing count. All buffers are reused for
+/// every layer on every sweep.
+struct LayerSweep<'a> {
+    graph: &'a LayoutGraph,
+    layer_of: &'a [u32],
+    rank: Vec<u32>,
+    neighbor_ranks: Vec<u32>,
+    spans: Vec<u32>,
+    keyed: Vec<(u32, u32, u32)>,
+    south: Vec<u32>,
+    tree: Vec<u32>,
+}
+
+impl<'a> LayerSweep<'a> {
+    fn new(graph: &'a LayoutGraph, layer_of: &'a [u32], max_layer_width: usize) -> Self {
+        Self {
+            graph,
+            layer_of,
+            rank: vec![0; graph.node_count()],
+            neighbor_ranks: Vec::new(),
+            spans: Vec::with_capacity(max_layer_width + 1),
+            keyed: Vec::with_capacity(max_layer_width),
+            south: Vec::new(),
+            tree: Vec::new(),
+        }
+    }
+
+    /// Runs one sweep over all layers and returns the resulting number of
+    /// crossings between adjacent layers. Top-down sweeps order each layer
+    /// against its predecessor; bottom-up sweeps against its successor.
+    ///
+    /// Each layer pair is counted right after its moving layer is ordered,
+    /// when neither side changes again during the sweep. Edges spanning more
+    /// than one layer are not counted.
+    #[allow(clippy::cast_possible_truncation)]
+    fn sweep(&mut self, nodes_by_layer: &mut [Vec<u32>], top_down: bool) -> u64 {
+        let layer_count = nodes_by_layer.len();
+        let mut crossings = 0;
+        if top_down {
+            for layer_idx in 1..layer_count {
+                let fixed = layer_idx - 1;
+                self.refresh_rank(&nodes_by_layer[fixed]);
+                let fixed_width = nodes_by_layer[fixed].len();
+                crossings += self.order_layer(
+                    fixed as u32,
+                    fixed_width,
+                    Direction::Incoming,
+                    &mut nodes_by_layer[layer_idx],
+                );
+            }
+        } else {
+            for layer_idx in (0..layer_count.saturating_sub(1)).rev() {
+                let fixed = layer_idx + 1;
+                self.refresh_rank(&nodes_by_layer[fixed]);
+                let fixed_width = nodes_by_layer[fixed].len();
+                crossings += self.order_layer(
+                    fixed as u32,
+                    fixed_width,
+                    Direction::Outgoing,
+                    &mut nodes_by_layer[layer_idx],
+                );
+            }
+        }
+        crossings
+    }
+
+    #[allow(clippy::cast_possible_truncation)]
+    fn refresh_rank(&mut self, layer: &[u32]) {
+        for (pos, &node) in layer.iter().enumerate() {
+            self.rank[node as usize] = pos as u32;
+        }
+    }
+
+    /// Reorders `layer` in place by the weighted median rank of each node's
+    /// neighbors on `fixed_layer`, looked up in `direction`, and returns the
+    /// crossings between the two layers in the new order.
+    ///
+    /// Nodes without neighbors on `fixed_layer` keep their current position
+    /// as their sort key. Ties are broken by node index, which makes every key
+    /// unique, so an unstable sort gives the same deterministic result.
+    #[allow(clippy::cast_precision_loss, clippy::cast_possible_truncation)]
+    fn order_layer(
+        &mut self,
+        fixed_layer: u32,
+        fixed_width: usize,
+        direction: Direction,
+        layer: &mut [u32],
+    ) -> u64 {
+        self.keyed.clear();
+        self.neighbor_ranks.clear();
+        self.spans.clear();
+        self.spans.push(0);
+        for (pos, &node) in layer.iter().enumerate() {
+            let start = self.neighbor_ranks.len();
+            self.neighbor_ranks.extend(
+                self.graph
+                    .neighbors(node, direction)
+                    .iter()
+                    .filter(|&&neighbor| self.layer_of[neighbor as usize] == fixed_layer)
+                    .map(|&neighbor| self.rank[neighbor as usize]),
+            );
+            let ranks = &mut self.neighbor_ranks[start..];
+            ranks.sort_unstable();
+            let key = weighted_median(ranks).unwrap_or(pos as f32);
+            self.spans.push(self.neighbor_ranks.len() as u32);
+            self.keyed.push((ordered_bits(key), node, pos as u32));
+        }
+
+        self.keyed.sort_unstable();
+        self.south.clear();
+        for (slot, &(_, node, pos)) in layer.iter_mut().zip(&self.keyed) {
+            *slot = node;
+            let pos = pos as usize;
+            let span = self.spans[pos] as usize..self.spans[pos + 1] as usize;
+            self.south.extend_from_slice(&self.neighbor_ranks[span]);
+        }
+        bilayer_crossings(&self.south, fixed_width, &mut self.tree)
+    }
+}
+
 impl DagLayout {
-    #[allow(
-        clippy::cast_precision_loss,
-        clippy::too_many_lines,
-        clippy::items_after_statements
-    )]
+    #[must_use]
+    pub const fn new(layer_spacing: f32, node_spacing: f32) -> Self {
+        Self {
+            layer_spacing,
+            node_spacing,
+            max_sweeps: 8,
+            cache: RefCell::new(None),
+        }
+    }
+
     pub fn apply(&self, workflow: &mut Workflow) {
         if workflow.nodes.is_empty() {
             return;
         }
 
-        let mut graph = Graph::<NodeId, ()>::new();
-        let mut index_map = HashMap::new();
-        let mut reverse_map = HashMap::new();
-        let mut node_order = HashMap::new();
+        let key = self.structure_key(workflow);
+        if let Some((cached_key, coords)) = self.cache.borrow().as_ref() {
+            if *cached_key == key && coords.len() == workflow.nodes.len() {
+                for (node, &(x, y)) in workflow.nodes.iter_mut().zip(coords) {
+                    node.x = x;
+                    node.y = y;
+                }
+                return;
+            }
+        }
 
-        // Add nodes to petgraph
-        for (order, node) in workflow.nodes.iter().enumerate() {
-            let idx = graph.add_node(node.id);
-            index_map.insert(node.id, idx);
-            reverse_map.insert(idx, node.id);
-            node_order.insert(idx, order);
+        if self.compute(workflow) {
+            let coords = workflow.nodes.iter().map(|n| (n.x, n.y)).collect();
+            *self.cache.borrow_mut() = Some((key, coords));
         }
+    }
 
-        // Add edges
+    /// Hashes everything the layout result depends on: node ids in order,
+    /// connection endpoints in order, and the layout parameters.
+    fn structure_key(&self, workflow: &Workflow) -> u64 {
+        let mut hasher = DefaultHasher::new();
+        self.layer_spacing.to_bits().hash(&mut hasher);
+        self.node_spacing.to_bits().hash(&mut hasher);
+        self.max_sweeps.hash(&mut hasher);
+        workflow.nodes.len().hash(&mut hasher);
+        for node in &workflow.nodes {
+            node.id.hash(&mut hasher);
+        }
         for conn in &workflow.connections {
-            if let (Some(&src), Some(&tgt)) =
-                (index_map.get(&conn.source), index_map.get(&conn.target))
-            {
-                graph.add_edge(src, tgt, ());
-            }
+            conn.source.hash(&mut hasher);
+            conn.target.hash(&mut hasher);
         }
+        hasher.finish()
+    }
+
+    /// Runs the full layout. Returns `false`, leaving positions untouched,
+    /// when the graph is cyclic.
+    #[allow(clippy::cast_precision_loss, clippy::too_many_lines)]
+    fn compute(&self, workflow: &mut Workflow) -> bool {
+        let graph = LayoutGraph::from_workflow(workflow);
 
-        // 1. Cycle Removal / Toposort
-        let Ok(sorted_indices) = toposort(&graph, None) else {
+        // 1-2. Cycle detection and layer assignment (longest path layering)
+        let Some((layer_of, mut nodes_by_layer)) = assign_layers(&graph) else {
             // If cyclic, try to layout what we can or return
-            return;
+            return false;
         };
 
-        // 2. Layer Assignment (Longest Path Layering)
-        let mut layers: HashMap<NodeIndex, usize> = HashMap::new();
-        for &node_idx in &sorted_indices {
-            let layer = graph
-                .neighbors_directed(node_idx, petgraph::Direction::Incoming)
-                .filter_map(|parent| layers.get(&parent).map(|&l| l + 1))
-                .max()
-                .map_or(0, |layer| layer);
-            layers.insert(node_idx, layer);
-        }
-
-        // Group by layer in deterministic topological order
-        let mut nodes_by_layer: Vec<Vec<NodeIndex>> = Vec::new();
-        for &node_idx in &sorted_indices {
-            let layer = layers.get(&node_idx).map_or(0, |value| *value);
-            while nodes_by_layer.len() <= layer {
-                nodes_by_layer.push(Vec::new());
+        // 3. Crossing minimization (weighted median, alternating sweeps)
+        //
+        // Sweeps alternate starting bottom-up. Sweeping stops at the first
+        // sweep that does not reduce the crossing count, which is undone, so
+        // the kept ordering is the best one seen and may come from a sweep in
+        // either direction. The previous ordering is only saved when another
+        // sweep may follow.
+        let max_layer_width = nodes_by_layer.iter().map(Vec::len).max().unwrap_or(0);
+        let mut layer_sweep = LayerSweep::new(&graph, &layer_of, max_layer_width);
+        let mut best_crossings = u64::MAX;
+        let mut best_order: Vec<Vec<u32>> = Vec::new();
+        for sweep in 0..self.max_sweeps {
+            let crossings = layer_sweep.sweep(&mut nodes_by_layer, sweep % 2 == 1);
+            if crossings >= best_crossings {
+                nodes_by_layer = best_order;
+                break;
             }
-            nodes_by_layer[layer].push(node_idx);
-        }
-
-        // 3. Crossing minimization (barycenter sweep)
-        // Optimized: use a position HashMap for O(1) index lookups instead of
-        // .iter().position() which is O(n) per call, called per node per iteration.
-        for _ in 0..4 {
-            for layer_idx in 1..nodes_by_layer.len() {
-                // Build position map for the previous layer: O(n) once per layer
-                let prev_positions: HashMap<NodeIndex, usize> = nodes_by_layer[layer_idx - 1]
-                    .iter()
-                    .enumerate()
-                    .map(|(pos, &node)| (node, pos))
-                    .collect();
-
-                let mut barycenters: Vec<(NodeIndex, f32)> = nodes_by_layer[layer_idx]
-                    .iter()
-                    .map(|&node| {
-                        let (sum, count) = graph
-                            .neighbors_directed(node, petgraph::Direction::Incoming)
-                            .filter_map(|parent| prev_positions.get(&parent).map(|&pos| pos as f32))
-                            .fold((0.0, 0.0), |(s, c), pos| (s + pos, c + 1.0));
-
-                        let barycenter = if count > 0.0 { sum / count } else { 0.0 };
-                        (node, barycenter)
-                    })
-                    .collect();
-
-                barycenters.sort_by(|a, b| {
-                    let order_a = node_order.get(&a.0).map_or(usize::MAX, |value| *value);
-                    let order_b = node_order.get(&b.0).map_or(usize::MAX, |value| *value);
-                    a.1.total_cmp(&b.1).then_with(|| order_a.cmp(&order_b))
-                });
-                nodes_by_layer[layer_idx] = barycenters.into_iter().map(|(n, _)| n).collect();
+            best_crossings = crossings;
+            if crossings == 0 || sweep + 1 == self.max_sweeps {
+                break;
             }
+            best_order.clone_from(&nodes_by_layer);
         }
 
         // 4. Coordinate assignment (left-to-right layered layout)
         //
-        // Pre-build a NodeId -> index map for O(1) node lookups instead of
-        // repeated workflow.nodes.iter_mut().find() which is O(n) per call.
-        let node_position_map: HashMap<NodeId, usize> = workflow
-            .nodes
-            .iter()
-            .enumerate()
-            .map(|(i, n)| (n.id, i))
-            .collect();
-
-        let mut y_by_index: HashMap<NodeIndex, f32> = HashMap::new();
+        // Positions are staged in dense per-node `xs`/`ys` arrays and copied
+        // onto the workflow in one pass at the end. Every parent sits in an
+        // earlier layer, so its y is always placed before its children read it.
+        let node_count = graph.node_count();
+        let mut xs: Vec<f32> = vec![0.0; node_count];
+        let mut ys: Vec<f32> = vec![0.0; node_count];
+        let mut layer_heights: Vec<f32> = Vec::with_capacity(nodes_by_layer.len());
         let mut max_layer_height = 0.0_f32;
 
         for (layer, nodes) in nodes_by_layer.iter().enumerate() {
-            let mut placed_y: Vec<f32> = Vec::new();
-
-            for node_idx in nodes {
-                let parent_positions = graph
-                    .neighbors_directed(*node_idx, petgraph::Direction::Incoming)
-                    .filter_map(|parent| y_by_index.get(&parent).copied())
-                    .collect::<Vec<_>>();
-
-                let preferred_y = if parent_positions.is_empty() {
-                    0.0
-                } else {
-                    parent_positions.iter().sum::<f32>() / (parent_positions.len() as f32)
-                };
-
-                let y = placed_y.last().map_or(preferred_y, |prev| {
-                    preferred_y.max(*prev + NODE_HEIGHT + self.node_spacing)
-                });
-                placed_y.push(y);
-                y_by_index.insert(*node_idx, y);
-            }
+            let x = (layer as f32) * (NODE_WIDTH + self.layer_spacing);
+            let mut bounds: Option<(f32, f32)> = None;
 
-            if let (Some(first), Some(last)) = (placed_y.first(), placed_y.last()) {
-                let layer_height = (last - first + NODE_HEIGHT).max(0.0);
-                max_layer_height = max_layer_height.max(layer_height);
-            }
+            for &node in nodes {
+                let (sum, count) = graph
+                    .neighbors(node, Direction::Incoming)
+                    .iter()
+                    .fold((0.0_f32, 0.0_f32), |(s, c), &parent| {
+                        (s + ys[parent as usize], c + 1.0)
+                    });
+                let preferred_y = if count > 0.0 { sum / count } else { 0.0 };
 
-            let x = (layer as f32) * (NODE_WIDTH + self.layer_spacing);
-            for node_idx in nodes {
-                if let Some(&node_id) = reverse_map.get(node_idx) {
-                    if let Some(&idx) = node_position_map.get(&node_id) {
-                        workflow.nodes[idx].x = x;
-                    }
-                }
+                let y = bounds.map_or(preferred_y, |(_, prev)| {
+                    preferred_y.max(prev + NODE_HEIGHT + self.node_spacing)
+                });
+                bounds = Some(bounds.map_or((y, y), |(first, _)| (first, y)));
+                xs[node as usize] = x;
+                ys[node as usize] = y;
             }
-        }
 
-        for nodes in &nodes_by_layer {
-            let layer_positions = nodes
-                .iter()
-                .filter_map(|idx| y_by_index.get(idx).copied())
-                .collect::<Vec<_>>();
-            if layer_positions.is_empty() {
-                continue;
-            }
+            let layer_height =
+                bounds.map_or(0.0, |(first, last)| (last - first + NODE_HEIGHT).max(0.0));
+            max_layer_height = max_layer_height.max(layer_height);
+            layer_heights.push(layer_height);
+        }
 
-            let first = layer_positions.first().map_or(0.0, |v| *v);
-            let last = layer_positions.last().map_or(0.0, |v| *v);
-            let layer_height = (last - first + NODE_HEIGHT).max(0.0);
+        for (nodes, layer_height) in nodes_by_layer.iter().zip(&layer_heights) {
             let layer_offset = (max_layer_height - layer_height) / 2.0;
-
-            for node_idx in nodes {
-                if let Some(&node_id) = reverse_map.get(node_idx) {
-                    if let Some(&idx) = node_position_map.get(&node_id) {
-                        let y = y_by_index.get(node_idx).map_or(0.0, |value| *value);
-                        workflow.nodes[idx].y = y + layer_offset;
-                    }
-                }
+            for &node in nodes {
+                ys[node as usize] += layer_offset;
             }
         }
 
-        // Single pass to find both min_x and min_y instead of two separate iterations
-        let (min_x, min_y) = workflow
-            .nodes
-            .iter()
-            .fold((f32::INFINITY, f32::INFINITY), |(mx, my), node| {
-                (mx.min(node.x), my.min(node.y))
-            });
-        let min_x = if min_x.is_finite() { min_x } else { 0.0 };
-        let min_y = if min_y.is_finite() { min_y } else { 0.0 };
+        let min_of = |values: &[f32]| {
+            let min = values.iter().copied().fold(f32::INFINITY, f32::min);
+            if min.is_finite() {
+                min
+            } else {
+                0.0
+            }
+        };
+        let (min_x, min_y) = (min_of(&xs), min_of(&ys));
 
-        for node in &mut workflow.nodes {
-            node.x = node.x - min_x + LEFT_PADDING;
-            node.y = node.y - min_y + TOP_PADDING;
+        for (node, (&x, &y)) in workflow.nodes.iter_mut().zip(xs.iter().zip(&ys)) {
+            node.x = x - min_x + LEFT_PADDING;
+            node.y = y - min_y + TOP_PADDING;
         }
+
+        true
     }
 }
 
@@ -221,7 +521,10 @@ impl DagLayout {
     clippy::float_cmp
 )]
 mod tests {
-    use super::{DagLayout, LEFT_PADDING, NODE_WIDTH, TOP_PADDING};
+    use super::{
+        assign_layers, bilayer_crossings, ordered_bits, weighted_median, Csr, DagLayout,
+        LayoutGraph, LEFT_PADDING, NODE_WIDTH, TOP_PADDING,
+    };
     use crate::graph::{Connection, NodeId, PortName, Workflow};
 
     #[test]
@@ -277,15 +580,16 @@ mod tests {
         let _ = workflow.add_connection_checked(n1, n2, &main, &main);
         let _ = workflow.add_connection_checked(n2, n3, &main, &main);
 
-        let layout = DagLayout::default();
-        layout.apply(&mut workflow);
+        DagLayout::default().apply(&mut workflow);
         let once: Vec<(String, f32, f32)> = workflow
             .nodes
             .iter()
             .map(|n| (n.name.clone(), n.x, n.y))
             .collect();
 
-        layout.apply(&mut workflow);
+        // A fresh layout, so the second run is computed rather than
+        // replayed from the first one's cache.
+        DagLayout::default().apply(&mut workflow);
         let twice: Vec<(String, f32, f32)> = workflow
             .nodes
             .iter()
@@ -433,6 +737,33 @@ mod tests {
         );
     }
 
+    #[test]
+    fn given_skip_edge_when_applying_layout_then_target_lands_on_longest_path_layer() {
+        let mut workflow = Workflow::new();
+        let a = workflow.add_node("http-handler", 0.0, 0.0);
+        let b = workflow.add_node("run", 0.0, 0.0);
+        let c = workflow.add_node("run", 0.0, 0.0);
+        let main = PortName::from("main");
+
+        // Insert the skip edge first so the topological order cannot rely on
+        // connection order.
+        let _ = workflow.add_connection_checked(a, c, &main, &main);
+        let _ = workflow.add_connection_checked(a, b, &main, &main);
+        let _ = workflow.add_connection_checked(b, c, &main, &main);
+
+        DagLayout::default().apply(&mut workflow);
+
+        let x_of = |id: NodeId| workflow.nodes.iter().find(|n| n.id == id).map(|n| n.x);
+        let (x_a, x_b, x_c) = (
+            x_of(a).expect("a"),
+            x_of(b).expect("b"),
+            x_of(c).expect("c"),
+        );
+
+        assert!((x_b - x_a - (NODE_WIDTH + 140.0)).abs() < 0.001);
+        assert!((x_c - x_b - (NODE_WIDTH + 140.0)).abs() < 0.001);
+    }
+
     // ---------------------------------------------------------------------------
     // Crossing minimization — deterministic output
     // ---------------------------------------------------------------------------
@@ -451,16 +782,132 @@ mod tests {
         let _ = workflow.add_connection_checked(b, d, &main, &main);
         let _ = workflow.add_connection_checked(c, d, &main, &main);
 
-        let layout = DagLayout::default();
-        layout.apply(&mut workflow);
+        DagLayout::default().apply(&mut workflow);
         let first: Vec<(f32, f32)> = workflow.nodes.iter().map(|n| (n.x, n.y)).collect();
 
-        layout.apply(&mut workflow);
+        // A fresh layout, so the second run is computed rather than
+        // replayed from the first one's cache.
+        DagLayout::default().apply(&mut workflow);
         let second: Vec<(f32, f32)> = workflow.nodes.iter().map(|n| (n.x, n.y)).collect();
 
         assert_eq!(first, second, "layout should be deterministic");
     }
 
+    #[test]
+    fn given_crossed_edges_when_applying_layout_then_children_are_reordered() {
+        let mut workflow = Workflow::new();
+        let a1 = workflow.add_node("http-handler", 0.0, 0.0);
+        let a2 = workflow.add_node("http-handler", 0.0, 0.0);
+        let b1 = workflow.add_node("run", 0.0, 0.0);
+        let b2 = workflow.add_node("run", 0.0, 0.0);
+        let main = PortName::from("main");
+
+        let _ = workflow.add_connection_checked(a1, b2, &main, &main);
+        let _ = workflow.add_connection_checked(a2, b1, &main, &main);
+
+        DagLayout::default().apply(&mut workflow);
+
+        let y_of = |id: NodeId| workflow.nodes.iter().find(|n| n.id == id).map(|n| n.y);
+        let sources_in_order = y_of(a1) < y_of(a2);
+        let targets_swapped = y_of(b2) < y_of(b1);
+
+        assert_eq!(
+            sources_in_order, targets_swapped,
+            "edges a1->b2 and a2->b1 cross"
+        );
+    }
+
+    #[test]
+    fn given_zero_max_sweeps_when_applying_layout_then_topological_order_is_kept() {
+        let mut workflow = Workflow::new();
+        let a1 = workflow.add_node("http-handler", 0.0, 0.0);
+        let a2 = workflow.add_node("http-handler", 0.0, 0.0);
+        let b1 = workflow.add_node("run", 0.0, 0.0);
+        let b2 = workflow.add_node("run", 0.0, 0.0);
+        let main = PortName::from("main");
+
+        let _ = workflow.add_connection_checked(a1, b2, &main, &main);
+        let _ = workflow.add_connection_checked(a2, b1, &main, &main);
+        let _ = workflow.add_connection_checked(a2, b2, &main, &main);
+
+        let layout = DagLayout {
+            max_sweeps: 0,
+            ..DagLayout::default()
+        };
+        layout.apply(&mut workflow);
+
+        let y_of = |id: NodeId| workflow.nodes.iter().find(|n| n.id == id).map(|n| n.y);
+        assert!(y_of(a1) < y_of(a2));
+        assert!(y_of(b1) < y_of(b2), "unswept layer keeps Kahn order");
+    }
+
+    #[test]
+    fn bilayer_crossings_counts_inversions_of_lower_ranks() {
+        let mut tree = Vec::new();
+
+        assert_eq!(bilayer_crossings(&[], 0, &mut tree), 0);
+        assert_eq!(bilayer_crossings(&[0, 1], 2, &mut tree), 0);
+        assert_eq!(bilayer_crossings(&[1, 0], 2, &mut tree), 1);
+        assert_eq!(bilayer_crossings(&[0, 0, 1], 2, &mut tree), 0);
+        assert_eq!(bilayer_crossings(&[1, 0, 1], 2, &mut tree), 1);
+        assert_eq!(bilayer_crossings(&[2, 1, 0], 3, &mut tree), 3);
+    }
+
+    #[test]
+    fn ordered_bits_preserves_float_order() {
+        let values = [
+            f32::NEG_INFINITY,
+            -2.5,
+            -0.0,
+            0.0,
+            0.5,
+            1.0,
+            3.0,
+            f32::INFINITY,
+        ];
+        for pair in values.windows(2) {
+            assert!(ordered_bits(pair[0]) < ordered_bits(pair[1]), "{pair:?}");
+        }
+    }
+
+    #[test]
+    fn csr_groups_neighbors_by_node_in_edge_order() {
+        let csr = Csr::from_edges(4, [(2, 0), (0, 3), (2, 1), (0, 1)].into_iter());
+
+        assert_eq!(csr.neighbors(0), &[3, 1]);
+        assert!(csr.neighbors(1).is_empty());
+        assert_eq!(csr.neighbors(2), &[0, 1]);
+        assert!(csr.neighbors(3).is_empty());
+    }
+
+    #[test]
+    fn assign_layers_orders_roots_by_workflow_insertion_order() {
+        let mut workflow = Workflow::new();
+        let child = workflow.add_node("run", 0.0, 0.0);
+        let r1 = workflow.add_node("http-handler", 0.0, 0.0);
+        let r2 = workflow.add_node("http-handler", 0.0, 0.0);
+        let main = PortName::from("main");
+        let _ = workflow.add_connection_checked(r2, child, &main, &main);
+        let _ = workflow.add_connection_checked(r1, child, &main, &main);
+
+        let graph = LayoutGraph::from_workflow(&workflow);
+        let layers = assign_layers(&graph).map(|(_, nodes_by_layer)| nodes_by_layer);
+
+        assert_eq!(layers, Some(vec![vec![1, 2], vec![0]]));
+    }
+
+    #[test]
+    fn weighted_median_handles_odd_even_and_empty_neighbor_sets() {
+        assert_eq!(weighted_median(&[]), None);
+        assert_eq!(weighted_median(&[4]), Some(4.0));
+        assert_eq!(weighted_median(&[1, 3, 9]), Some(3.0));
+        assert_eq!(weighted_median(&[2, 5]), Some(3.5));
+        // Left pair is tighter (spread 1) than the right pair (spread 6), so the
+        // median is pulled towards the lower middle position.
+        assert_eq!(weighted_median(&[0, 1, 2, 8]), Some(8.0 / 7.0));
+        assert_eq!(weighted_median(&[3, 3, 3, 3]), Some(3.0));
+    }
+
     // ---------------------------------------------------------------------------
     // Custom spacing
     // ---------------------------------------------------------------------------
@@ -474,10 +921,7 @@ mod tests {
 
         let _ = workflow.add_connection_checked(a, b, &main, &main);
 
-        let custom_layout = DagLayout {
-            layer_spacing: 300.0,
-            node_spacing: 80.0,
-        };
+        let custom_layout = DagLayout::new(300.0, 80.0);
         custom_layout.apply(&mut workflow);
 
         let x_a = workflow.nodes.iter().find(|n| n.id == a).map(|n| n.x);
@@ -495,6 +939,59 @@ mod tests {
         );
     }
 
+    // ---------------------------------------------------------------------------
+    // Layout cache
+    // ---------------------------------------------------------------------------
+
+    #[test]
+    fn given_cached_layout_when_nodes_are_moved_then_cached_positions_are_restored() {
+        let mut workflow = Workflow::new();
+        let a = workflow.add_node("http-handler", 0.0, 0.0);
+        let b = workflow.add_node("run", 0.0, 0.0);
+        let main = PortName::from("main");
+        let _ = workflow.add_connection_checked(a, b, &main, &main);
+
+        let layout = DagLayout::default();
+        layout.apply(&mut workflow);
+        let first: Vec<(f32, f32)> = workflow.nodes.iter().map(|n| (n.x, n.y)).collect();
+
+        for node in &mut workflow.nodes {
+            node.x += 500.0;
+            node.y -= 250.0;
+        }
+        layout.apply(&mut workflow);
+        let second: Vec<(f32, f32)> = workflow.nodes.iter().map(|n| (n.x, n.y)).collect();
+
+        assert_eq!(first, second);
+    }
+
+    #[test]
+    fn given_cached_layout_when_topology_changes_then_layout_is_recomputed() {
+        let mut workflow = Workflow::new();
+        let a = workflow.add_node("http-handler", 0.0, 0.0);
+        let b = workflow.add_node("run", 0.0, 0.0);
+        let main = PortName::from("main");
+
+        let layout = DagLayout::default();
+        layout.apply(&mut workflow);
+        let x_of = |workflow: &Workflow, id: NodeId| {
+            workflow.nodes.iter().find(|n| n.id == id).map(|n| n.x)
+        };
+        assert_eq!(x_of(&workflow, a), x_of(&workflow, b));
+
+        let _ = workflow.add_connection_checked(a, b, &main, &main);
+        layout.apply(&mut workflow);
+
+        let fresh = {
+            let mut copy = workflow.clone();
+            DagLayout::default().apply(&mut copy);
+            copy.nodes.iter().map(|n| (n.x, n.y)).collect::<Vec<_>>()
+        };
+        let cached: Vec<(f32, f32)> = workflow.nodes.iter().map(|n| (n.x, n.y)).collect();
+        assert!(x_of(&workflow, a) < x_of(&workflow, b));
+        assert_eq!(cached, fresh);
+    }
+
     // ---------------------------------------------------------------------------
     // Disconnected graph — all nodes should get distinct positions
     // ---------------------------------------------------------------------------
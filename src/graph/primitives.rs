@@ -96,26 +96,90 @@ impl fmt::Display for PortName {
 
 #[derive(Debug, Clone, Copy, Serialize, Deserialize, PartialEq, Eq, Hash)]
 #[serde(rename_all = "lowercase")]
+#[repr(u8)]
 pub enum NodeCategory {
-    Entry,
-    Durable,
-    State,
-    Flow,
-    Timing,
-    Signal,
+    Entry = 0,
+    Durable = 1,
+    State = 2,
+    Flow = 3,
+    Timing = 4,
+    Signal = 5,
+}
+
+/// Per-category lookup tables, indexed by the `#[repr(u8)]` discriminant.
+const CATEGORY_NAMES: [&str; 6] = ["entry", "durable", "state", "flow", "timing", "signal"];
+
+const CATEGORY_BORDER_CLASSES: [&str; 6] = [
+    "border-emerald-500/40",
+    "border-indigo-500/40",
+    "border-orange-500/40",
+    "border-amber-500/40",
+    "border-pink-500/40",
+    "border-blue-500/40",
+];
+
+const CATEGORY_ICON_CLASSES: [&str; 6] = [
+    "bg-emerald-500/15 text-emerald-400",
+    "bg-indigo-500/15 text-indigo-500",
+    "bg-orange-500/15 text-orange-400",
+    "bg-amber-500/15 text-amber-400",
+    "bg-pink-500/15 text-pink-400",
+    "bg-blue-500/15 text-blue-400",
+];
+
+const CATEGORY_ACCENT_BAR_CLASSES: [&str; 6] = [
+    "bg-emerald-500/40",
+    "bg-indigo-500/40",
+    "bg-orange-500/40",
+    "bg-amber-500/40",
+    "bg-pink-500/40",
+    "bg-blue-500/40",
+];
+
+const CATEGORY_BADGE_CLASSES: [&str; 6] = [
+    "bg-emerald-50 text-emerald-700 border-emerald-200",
+    "bg-indigo-50 text-indigo-700 border-indigo-200",
+    "bg-orange-50 text-orange-700 border-orange-200",
+    "bg-amber-50 text-amber-700 border-amber-200",
+    "bg-pink-50 text-pink-700 border-pink-200",
+    "bg-blue-50 text-blue-700 border-blue-200",
+];
+
+impl NodeCategory {
+    /// Lowercase name, matching the serde representation.
+    #[must_use]
+    pub const fn as_str(self) -> &'static str {
+        CATEGORY_NAMES[self as usize]
+    }
+
+    /// Tailwind border colour for the node card.
+    #[must_use]
+    pub const fn border_class(self) -> &'static str {
+        CATEGORY_BORDER_CLASSES[self as usize]
+    }
+
+    /// Tailwind background and text colours for the node card icon.
+    #[must_use]
+    pub const fn icon_class(self) -> &'static str {
+        CATEGORY_ICON_CLASSES[self as usize]
+    }
+
+    /// Tailwind background for the accent bar under the node card.
+    #[must_use]
+    pub const fn accent_bar_class(self) -> &'static str {
+        CATEGORY_ACCENT_BAR_CLASSES[self as usize]
+    }
+
+    /// Tailwind badge colours for the selected-node panel.
+    #[must_use]
+    pub const fn badge_classes(self) -> &'static str {
+        CATEGORY_BADGE_CLASSES[self as usize]
+    }
 }
 
 impl fmt::Display for NodeCategory {
     fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
-        let s = match self {
-            Self::Entry => "entry",
-            Self::Durable => "durable",
-            Self::State => "state",
-            Self::Flow => "flow",
-            Self::Timing => "timing",
-            Self::Signal => "signal",
-        };
-        write!(f, "{s}")
+        f.write_str(self.as_str())
     }
 }
 
@@ -195,4 +259,39 @@ mod tests {
             assert_eq!(port.into_inner(), "main");
         }
     }
+
+    mod node_category {
+        use super::*;
+
+        const ALL: [NodeCategory; 6] = [
+            NodeCategory::Entry,
+            NodeCategory::Durable,
+            NodeCategory::State,
+            NodeCategory::Flow,
+            NodeCategory::Timing,
+            NodeCategory::Signal,
+        ];
+
+        #[test]
+        fn display_matches_serde_name() {
+            for category in ALL {
+                let json = serde_json::to_string(&category).unwrap();
+                assert_eq!(json, format!("\"{category}\""));
+            }
+        }
+
+        #[test]
+        fn class_tables_line_up_with_variants() {
+            assert_eq!(NodeCategory::Entry.border_class(), "border-emerald-500/40");
+            assert_eq!(
+                NodeCategory::State.icon_class(),
+                "bg-orange-500/15 text-orange-400"
+            );
+            assert_eq!(NodeCategory::Timing.accent_bar_class(), "bg-pink-500/40");
+            assert_eq!(
+                NodeCategory::Signal.badge_classes(),
+                "bg-blue-50 text-blue-700 border-blue-200"
+            );
+        }
+    }
 }
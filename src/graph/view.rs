@@ -15,10 +15,15 @@ const fn clamp_zoom(value: f32) -> f32 {
     }
 }
 
+thread_local! {
+    // Kept alive across calls so `DagLayout`'s structure cache can replay
+    // coordinates when the workflow topology has not changed.
+    static LAYOUT: DagLayout = DagLayout::default();
+}
+
 impl Workflow {
     pub fn apply_layout(&mut self) {
-        let layout = DagLayout::default();
-        layout.apply(self);
+        LAYOUT.with(|layout| layout.apply(self));
     }
 
     pub fn zoom(&mut self, delta: f32, cx: f32, cy: f32) {
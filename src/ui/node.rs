@@ -5,7 +5,7 @@
 #![warn(clippy::nursery)]
 #![forbid(unsafe_code)]
 
-use crate::graph::{ExecutionState, Node, NodeCategory};
+use crate::graph::{ExecutionState, Node};
 use crate::ui::icons::icon_by_name;
 use crate::ui::InlineConfigPanel;
 use dioxus::prelude::*;
@@ -105,32 +105,9 @@ pub fn FlowNodeComponent(
     let icon = node.icon.clone();
     let exec_state = node.execution_state;
 
-    let category_border = match category {
-        NodeCategory::Entry => "border-emerald-500/40",
-        NodeCategory::Durable => "border-indigo-500/40",
-        NodeCategory::State => "border-orange-500/40",
-        NodeCategory::Flow => "border-amber-500/40",
-        NodeCategory::Timing => "border-pink-500/40",
-        NodeCategory::Signal => "border-blue-500/40",
-    };
-
-    let category_icon_bg = match category {
-        NodeCategory::Entry => "bg-emerald-500/15 text-emerald-400",
-        NodeCategory::Durable => "bg-indigo-500/15 text-indigo-500",
-        NodeCategory::State => "bg-orange-500/15 text-orange-400",
-        NodeCategory::Flow => "bg-amber-500/15 text-amber-400",
-        NodeCategory::Timing => "bg-pink-500/15 text-pink-400",
-        NodeCategory::Signal => "bg-blue-500/15 text-blue-400",
-    };
-
-    let category_accent_bar = match category {
-        NodeCategory::Entry => "bg-emerald-500/40",
-        NodeCategory::Durable => "bg-indigo-500/40",
-        NodeCategory::State => "bg-orange-500/40",
-        NodeCategory::Flow => "bg-amber-500/40",
-        NodeCategory::Timing => "bg-pink-500/40",
-        NodeCategory::Signal => "bg-blue-500/40",
-    };
+    let category_border = category.border_class();
+    let category_icon_bg = category.icon_class();
+    let category_accent_bar = category.accent_bar_class();
 
     let exec_border = node_border_class(exec_state);
 
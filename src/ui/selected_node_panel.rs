@@ -7,7 +7,7 @@ use crate::flow_extender::{
     apply_extension, extension_presets, preview_extension, resolve_extension_preset,
     suggest_extensions, ExtensionPatchPreview, ExtensionPriority,
 };
-use crate::graph::{Node, NodeCategory, NodeId, Workflow};
+use crate::graph::{Node, NodeId, Workflow};
 use dioxus::prelude::*;
 use itertools::Itertools;
 use std::collections::HashMap;
@@ -38,14 +38,7 @@ pub fn SelectedNodePanel(
 
     if let Some(node_id) = *selected_node_id.read() {
         if let Some(selected_node) = nodes_by_id.read().get(&node_id).cloned() {
-            let badge_classes = match selected_node.category {
-                NodeCategory::Entry => "bg-emerald-50 text-emerald-700 border-emerald-200",
-                NodeCategory::Durable => "bg-indigo-50 text-indigo-700 border-indigo-200",
-                NodeCategory::State => "bg-orange-50 text-orange-700 border-orange-200",
-                NodeCategory::Flow => "bg-amber-50 text-amber-700 border-amber-200",
-                NodeCategory::Timing => "bg-pink-50 text-pink-700 border-pink-200",
-                NodeCategory::Signal => "bg-blue-50 text-blue-700 border-blue-200",
-            };
+            let badge_classes = selected_node.category.badge_classes();
 
             return rsx! {
                 aside { class: "animate-slide-in-right z-30 flex w-[320px] shrink-0 flex-col border-l border-slate-200 bg-white/95",
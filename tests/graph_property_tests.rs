@@ -418,12 +418,13 @@ proptest! {
             let _ = wf.add_connection_checked(ids[i], ids[i + 1], &port, &port);
         }
 
-        let layout = DagLayout::default();
-        layout.apply(&mut wf);
+        DagLayout::default().apply(&mut wf);
 
         let first_positions: Vec<(f32, f32)> = wf.nodes.iter().map(|n| (n.x, n.y)).collect();
 
-        layout.apply(&mut wf);
+        // A fresh layout, so the second run is computed rather than
+        // replayed from the first one's cache.
+        DagLayout::default().apply(&mut wf);
         let second_positions: Vec<(f32, f32)> = wf.nodes.iter().map(|n| (n.x, n.y)).collect();
 
         prop_assert_eq!(first_positions, second_positions,
@@ -1,6 +1,8 @@
-import re
+from pathlib import Path
 
-content = open("src/ui/edges.rs").read()
+from codemod import write_atomic
+
+TARGET = "src/ui/edges.rs"
 
 old_path = """fn create_smooth_step_path(from: Position, to: Position) -> String {
     let mid_y = f32::midpoint(from.y, to.y);
@@ -31,3 +33,15 @@ old_path = """fn create_smooth_step_path(from: Position, to: Position) -> String
 }"""
 
 # Actually, the existing `create_smooth_step_path` looks completely identical to Busted Flow's math (which was likely derived from it). Let's just adjust the UI edge styling a bit if we need to. Let's see what else there is. 
+
+
+def rewrite(content):
+    return content
+
+
+def run():
+    write_atomic(TARGET, rewrite(Path(TARGET).read_text()))
+
+
+if __name__ == "__main__":
+    run()
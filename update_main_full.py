@@ -0,0 +1,123 @@
+from pathlib import Path
+
+from codemod import replace_all, write_atomic
+
+TARGET = "src/main.rs"
+
+old_badges = """                            let badge_classes = match selected_node.category {
+                                oya_frontend::graph::NodeCategory::Trigger => {
+                                    "bg-emerald-500/15 text-emerald-300 border-emerald-500/25"
+                                }
+                                oya_frontend::graph::NodeCategory::Action => {
+                                    "bg-indigo-500/15 text-indigo-300 border-indigo-500/25"
+                                }
+                                oya_frontend::graph::NodeCategory::Logic => {
+                                    "bg-amber-500/15 text-amber-300 border-amber-500/25"
+                                }
+                                oya_frontend::graph::NodeCategory::Output => {
+                                    "bg-pink-500/15 text-pink-300 border-pink-500/25"
+                                }
+                                oya_frontend::graph::NodeCategory::Restate => {
+                                    "bg-blue-500/15 text-blue-300 border-blue-500/25"
+                                }
+                            };"""
+
+new_badges = """                            let badge_classes = match selected_node.category {
+                                oya_frontend::graph::NodeCategory::Entry => {
+                                    "bg-emerald-500/15 text-emerald-300 border-emerald-500/25"
+                                }
+                                oya_frontend::graph::NodeCategory::Durable => {
+                                    "bg-indigo-500/15 text-indigo-300 border-indigo-500/25"
+                                }
+                                oya_frontend::graph::NodeCategory::State => {
+                                    "bg-orange-500/15 text-orange-300 border-orange-500/25"
+                                }
+                                oya_frontend::graph::NodeCategory::Flow => {
+                                    "bg-amber-500/15 text-amber-300 border-amber-500/25"
+                                }
+                                oya_frontend::graph::NodeCategory::Timing => {
+                                    "bg-pink-500/15 text-pink-300 border-pink-500/25"
+                                }
+                                oya_frontend::graph::NodeCategory::Signal => {
+                                    "bg-blue-500/15 text-blue-300 border-blue-500/25"
+                                }
+                            };"""
+
+new_init = """        Workflow {
+            nodes: vec![
+                oya_frontend::graph::Node {
+                    id: oya_frontend::graph::NodeId::new(),
+                    name: "HTTP Handler".to_string(),
+                    description: "POST /SignupWorkflow/{userId}/run".to_string(),
+                    node_type: "http-handler".to_string(),
+                    category: oya_frontend::graph::NodeCategory::Entry,
+                    icon: "globe".to_string(),
+                    x: 350.0,
+                    y: 40.0,
+                    config: serde_json::json!({"configured": true, "status": "completed", "journalIndex": 0}),
+                    last_output: None,
+                    selected: false,
+                    executing: false,
+                    skipped: false,
+                    error: None,
+                },
+                oya_frontend::graph::Node {
+                    id: oya_frontend::graph::NodeId::new(),
+                    name: "Durable Step".to_string(),
+                    description: "Create user in database".to_string(),
+                    node_type: "run".to_string(),
+                    category: oya_frontend::graph::NodeCategory::Durable,
+                    icon: "shield".to_string(),
+                    x: 350.0,
+                    y: 170.0,
+                    config: serde_json::json!({"configured": true, "status": "completed", "durableStepName": "create-user", "journalIndex": 1}),
+                    last_output: None,
+                    selected: false,
+                    executing: false,
+                    skipped: false,
+                    error: None,
+                },
+                oya_frontend::graph::Node {
+                    id: oya_frontend::graph::NodeId::new(),
+                    name: "If / Else".to_string(),
+                    description: "Check if user creation succeeded".to_string(),
+                    node_type: "condition".to_string(),
+                    category: oya_frontend::graph::NodeCategory::Flow,
+                    icon: "git-branch".to_string(),
+                    x: 350.0,
+                    y: 300.0,
+                    config: serde_json::json!({"configured": true, "status": "completed", "journalIndex": 2}),
+                    last_output: None,
+                    selected: false,
+                    executing: false,
+                    skipped: false,
+                    error: None,
+                }
+            ],
+            connections: vec![], // we'll omit connections initially to keep it simple, user can connect them
+            viewport: oya_frontend::graph::Viewport { x: 0.0, y: 0.0, zoom: 0.85 },
+            execution_queue: vec![],
+            current_step: 0,
+            history: vec![],
+        }"""
+
+
+def rewrite(content):
+    content = replace_all(
+        content,
+        {
+            old_badges: new_badges,
+            "Workflow::new()": new_init,
+            "workflow_name = use_signal(|| \"API Data Pipeline\".to_string())": "workflow_name = use_signal(|| \"SignupWorkflow\".to_string())",
+        },
+        limits={"Workflow::new()": 1},  # Only replace the first one in the signal init
+    )
+    return content
+
+
+def run():
+    write_atomic(TARGET, rewrite(Path(TARGET).read_text()))
+
+
+if __name__ == "__main__":
+    run()
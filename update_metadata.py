@@ -1,6 +1,8 @@
-import re
+from pathlib import Path
 
-content = open("src/graph/mod.rs").read()
+from codemod import replace_between, write_atomic
+
+TARGET = "src/graph/mod.rs"
 
 new_fn = """    fn get_node_metadata(node_type: &str) -> (NodeCategory, String, String) {
         match node_type {
@@ -132,8 +134,15 @@ new_fn = """    fn get_node_metadata(node_type: &str) -> (NodeCategory, String,
         }
     }"""
 
-pattern = r"    fn get_node_metadata.*?\}\n    \}"
-content = re.sub(pattern, new_fn, content, flags=re.DOTALL)
 
-with open("src/graph/mod.rs", "w") as f:
-    f.write(content)
+def rewrite(content):
+    content = replace_between(content, "    fn get_node_metadata", "}\n    }", new_fn)
+    return content
+
+
+def run():
+    write_atomic(TARGET, rewrite(Path(TARGET).read_text()))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,121 @@
+from pathlib import Path
+
+from codemod import replace_all, write_atomic
+
+TARGET = "src/graph/mod.rs"
+
+old_enum = """pub enum NodeCategory {
+    Trigger,
+    Action,
+    Logic,
+    Output,
+    Restate,
+}"""
+
+new_enum = """#[repr(u8)]
+pub enum NodeCategory {
+    Entry = 0,
+    Durable = 1,
+    State = 2,
+    Flow = 3,
+    Timing = 4,
+    Signal = 5,
+}
+
+/// Per-category lookup tables, indexed by the `#[repr(u8)]` discriminant.
+const CATEGORY_NAMES: [&str; 6] = ["entry", "durable", "state", "flow", "timing", "signal"];
+
+const CATEGORY_BORDER_CLASSES: [&str; 6] = [
+    "border-emerald-500/40",
+    "border-indigo-500/40",
+    "border-orange-500/40",
+    "border-amber-500/40",
+    "border-pink-500/40",
+    "border-blue-500/40",
+];
+
+const CATEGORY_ICON_CLASSES: [&str; 6] = [
+    "bg-emerald-500/15 text-emerald-400",
+    "bg-indigo-500/15 text-indigo-500",
+    "bg-orange-500/15 text-orange-400",
+    "bg-amber-500/15 text-amber-400",
+    "bg-pink-500/15 text-pink-400",
+    "bg-blue-500/15 text-blue-400",
+];
+
+const CATEGORY_ACCENT_BAR_CLASSES: [&str; 6] = [
+    "bg-emerald-500/40",
+    "bg-indigo-500/40",
+    "bg-orange-500/40",
+    "bg-amber-500/40",
+    "bg-pink-500/40",
+    "bg-blue-500/40",
+];
+
+const CATEGORY_BADGE_CLASSES: [&str; 6] = [
+    "bg-emerald-50 text-emerald-700 border-emerald-200",
+    "bg-indigo-50 text-indigo-700 border-indigo-200",
+    "bg-orange-50 text-orange-700 border-orange-200",
+    "bg-amber-50 text-amber-700 border-amber-200",
+    "bg-pink-50 text-pink-700 border-pink-200",
+    "bg-blue-50 text-blue-700 border-blue-200",
+];
+
+impl NodeCategory {
+    /// Lowercase name, matching the serde representation.
+    #[must_use]
+    pub const fn as_str(self) -> &'static str {
+        CATEGORY_NAMES[self as usize]
+    }
+
+    /// Tailwind border colour for the node card.
+    #[must_use]
+    pub const fn border_class(self) -> &'static str {
+        CATEGORY_BORDER_CLASSES[self as usize]
+    }
+
+    /// Tailwind background and text colours for the node card icon.
+    #[must_use]
+    pub const fn icon_class(self) -> &'static str {
+        CATEGORY_ICON_CLASSES[self as usize]
+    }
+
+    /// Tailwind background for the accent bar under the node card.
+    #[must_use]
+    pub const fn accent_bar_class(self) -> &'static str {
+        CATEGORY_ACCENT_BAR_CLASSES[self as usize]
+    }
+
+    /// Tailwind badge colours for the selected-node panel.
+    #[must_use]
+    pub const fn badge_classes(self) -> &'static str {
+        CATEGORY_BADGE_CLASSES[self as usize]
+    }
+}"""
+
+old_fmt = """        let s = match self {
+            Self::Trigger => "trigger",
+            Self::Action => "action",
+            Self::Logic => "logic",
+            Self::Output => "output",
+            Self::Restate => "restate",
+        };"""
+
+new_fmt = """        let s = self.as_str();"""
+
+old_func = """    fn get_node_metadata(node_type: &str) -> (NodeCategory, String, String) {"""
+new_func = """    #[allow(clippy::too_many_lines)]
+    fn get_node_metadata(node_type: &str) -> (NodeCategory, String, String) {"""
+
+
+def rewrite(content):
+    content = replace_all(content, {old_enum: new_enum, old_fmt: new_fmt, old_func: new_func})
+    return content
+
+
+def run():
+    write_atomic(TARGET, rewrite(Path(TARGET).read_text()))
+
+
+if __name__ == "__main__":
+    run()
@@ -1,6 +1,8 @@
-import re
+from pathlib import Path
 
-content = open("src/ui/node.rs").read()
+from codemod import replace_all, write_atomic
+
+TARGET = "src/ui/node.rs"
 
 old_status = """                // Status indicator
                 div { class: "ml-auto shrink-0",
@@ -73,7 +75,15 @@ new_status = """                // Status indicator
                 }
             }"""
 
-content = content.replace(old_status, new_status)
 
-with open("src/ui/node.rs", "w") as f:
-    f.write(content)
+def rewrite(content):
+    content = replace_all(content, {old_status: new_status})
+    return content
+
+
+def run():
+    write_atomic(TARGET, rewrite(Path(TARGET).read_text()))
+
+
+if __name__ == "__main__":
+    run()
@@ -1,8 +1,8 @@
-import re
+from pathlib import Path
 
-content = open("src/ui/sidebar.rs").read()
+from codemod import replace_all, replace_between, write_atomic
 
-old_templates = r"const NODE_TEMPLATES.*?\];"
+TARGET = "src/ui/sidebar.rs"
 
 new_templates = """const NODE_TEMPLATES: [NodeTemplate; 24] = [
     NodeTemplate { node_type: "http-handler", label: "HTTP Handler", description: "Handle HTTP/gRPC invocation", icon: "globe", category: "entry" },
@@ -36,8 +36,6 @@ new_templates = """const NODE_TEMPLATES: [NodeTemplate; 24] = [
     NodeTemplate { node_type: "signal-handler", label: "Signal Handler", description: "Shared handler for signals", icon: "radio", category: "signal" },
 ];"""
 
-content = re.sub(old_templates, new_templates, content, flags=re.DOTALL)
-
 old_cat_match = """                    let category_label = match cat {
                         "trigger" => "Triggers",
                         "action" => "Actions",
@@ -57,13 +55,9 @@ new_cat_match = """                    let category_label = match cat {
                         _ => cat,
                     };"""
 
-content = content.replace(old_cat_match, new_cat_match)
-
 old_order = """        let categories = ["trigger", "action", "logic", "output", "restate"];"""
 new_order = """        let categories = ["entry", "durable", "state", "flow", "timing", "signal"];"""
 
-content = content.replace(old_order, new_order)
-
 old_border_bg = """                                    let (border_color, text_color, bg_color) = match template.category {
                                         "trigger" => ("border-emerald-500/20", "text-emerald-400", "bg-emerald-500/10"),
                                         "action" => ("border-indigo-500/20", "text-indigo-400", "bg-indigo-500/10"),
@@ -83,7 +77,20 @@ new_border_bg = """                                    let (border_color, text_c
                                         _ => ("border-slate-700", "text-slate-400", "bg-slate-800"),
                                     };"""
 
-content = content.replace(old_border_bg, new_border_bg)
 
-with open("src/ui/sidebar.rs", "w") as f:
-    f.write(content)
+def rewrite(content):
+    content = replace_between(content, "const NODE_TEMPLATES", "];", new_templates)
+    content = replace_all(content, {
+        old_cat_match: new_cat_match,
+        old_order: new_order,
+        old_border_bg: new_border_bg,
+    })
+    return content
+
+
+def run():
+    write_atomic(TARGET, rewrite(Path(TARGET).read_text()))
+
+
+if __name__ == "__main__":
+    run()
@@ -1,6 +1,8 @@
-import re
+from pathlib import Path
 
-content = open("src/ui/sidebar.rs").read()
+from codemod import replace_all, write_atomic
+
+TARGET = "src/ui/sidebar.rs"
 
 old_ico_bg = """fn category_icon_bg(category: &str) -> &'static str {
     match category {
@@ -51,9 +53,19 @@ new_cat_label = """fn category_label(category: &str) -> &'static str {
 old_loop_array = """for category in ["restate", "trigger", "action", "logic", "output"] {"""
 new_loop_array = """for category in ["entry", "durable", "state", "flow", "timing", "signal"] {"""
 
-content = content.replace(old_ico_bg, new_ico_bg)
-content = content.replace(old_cat_label, new_cat_label)
-content = content.replace(old_loop_array, new_loop_array)
 
-with open("src/ui/sidebar.rs", "w") as f:
-    f.write(content)
+def rewrite(content):
+    content = replace_all(content, {
+        old_ico_bg: new_ico_bg,
+        old_cat_label: new_cat_label,
+        old_loop_array: new_loop_array,
+    })
+    return content
+
+
+def run():
+    write_atomic(TARGET, rewrite(Path(TARGET).read_text()))
+
+
+if __name__ == "__main__":
+    run()
@@ -1,61 +1,92 @@
+import mmap
+import os
 import re
 
-content = open("src/ui/node.rs").read()
-
-old_border = """    let category_border = match category {
-        NodeCategory::Trigger => "border-emerald-500/40",
-        NodeCategory::Action => "border-indigo-500/40",
-        NodeCategory::Logic => "border-amber-500/40",
-        NodeCategory::Output => "border-pink-500/40",
-        NodeCategory::Restate => "border-blue-500/40",
-    };"""
-
-new_border = """    let category_border = match category {
-        NodeCategory::Entry => "border-emerald-500/40",
-        NodeCategory::Durable => "border-indigo-500/40",
-        NodeCategory::State => "border-orange-500/40",
-        NodeCategory::Flow => "border-amber-500/40",
-        NodeCategory::Timing => "border-pink-500/40",
-        NodeCategory::Signal => "border-blue-500/40",
-    };"""
-
-old_bg = """    let category_icon_bg = match category {
-        NodeCategory::Trigger => "bg-emerald-500/15 text-emerald-400",
-        NodeCategory::Action => "bg-indigo-500/15 text-indigo-500",
-        NodeCategory::Logic => "bg-amber-500/15 text-amber-400",
-        NodeCategory::Output => "bg-pink-500/15 text-pink-400",
-        NodeCategory::Restate => "bg-blue-500/15 text-blue-400",
-    };"""
-
-new_bg = """    let category_icon_bg = match category {
-        NodeCategory::Entry => "bg-emerald-500/15 text-emerald-400",
-        NodeCategory::Durable => "bg-indigo-500/15 text-indigo-500",
-        NodeCategory::State => "bg-orange-500/15 text-orange-400",
-        NodeCategory::Flow => "bg-amber-500/15 text-amber-400",
-        NodeCategory::Timing => "bg-pink-500/15 text-pink-400",
-        NodeCategory::Signal => "bg-blue-500/15 text-blue-400",
-    };"""
-
-old_accent = """    let category_accent_bar = match category {
-        NodeCategory::Trigger => "bg-emerald-500/40",
-        NodeCategory::Action => "bg-indigo-500/40",
-        NodeCategory::Logic => "bg-amber-500/40",
-        NodeCategory::Output => "bg-pink-500/40",
-        NodeCategory::Restate => "bg-blue-500/40",
-    };"""
-
-new_accent = """    let category_accent_bar = match category {
-        NodeCategory::Entry => "bg-emerald-500/40",
-        NodeCategory::Durable => "bg-indigo-500/40",
-        NodeCategory::State => "bg-orange-500/40",
-        NodeCategory::Flow => "bg-amber-500/40",
-        NodeCategory::Timing => "bg-pink-500/40",
-        NodeCategory::Signal => "bg-blue-500/40",
-    };"""
-
-content = content.replace(old_border, new_border)
-content = content.replace(old_bg, new_bg)
-content = content.replace(old_accent, new_accent)
-
-with open("src/ui/node.rs", "w") as f:
-    f.write(content)
+from codemod import patch_mapped, sub_anchored
+
+TARGET = "src/ui/node.rs"
+
+# node.rs is ASCII, so the rewrite works on raw bytes and skips the UTF-8
+# decode/encode round trip. run_codemods.py hands BINARY modules bytes.
+BINARY = True
+
+# The category match blocks only differ from the new ones by variant names,
+# plus a State arm that reuses the Entry classes in orange.
+RENAMES = {
+    b"Trigger": b"Entry",
+    b"Action": b"Durable",
+    b"Logic": b"Flow",
+    b"Output": b"Timing",
+    b"Restate": b"Signal",
+}
+OLD_VARIANTS = b"|".join(RENAMES)
+
+# Full token -> replacement pairs and the State arm pieces, built once at
+# import so per-match callbacks are a few C-level bytes operations.
+PATCHES = {b"NodeCategory::" + old: b"NodeCategory::" + new for old, new in RENAMES.items()}
+# BLOCK only matches arms of the form "NodeCategory::<Old> => ", so renaming
+# with that suffix attached is exact without a word-boundary check.
+ARM_PATCHES = [(old + b" => ", new + b" => ") for old, new in PATCHES.items()]
+STATE_ARM = b"NodeCategory::State => "
+ENTRY_TONE, STATE_TONE = b"emerald", b"orange"
+MIGRATED_MARKER = b"NodeCategory::Entry"
+
+# Migrated files name the new variants near the top, so re-runs only touch
+# the first pages of the file.
+HEADER_BYTES = 64 * 1024
+
+# Every block starts with this literal, so the scan can jump between its
+# occurrences with bytes.find and only run BLOCK at those offsets.
+BLOCK_ANCHOR = b"    let category_"
+BLOCK = re.compile(
+    re.escape(BLOCK_ANCHOR) + rb"\w+ = match category \{\n"
+    rb"(?:        NodeCategory::(?:" + OLD_VARIANTS + rb") => [^\n]*\n)+"
+    rb"    \};"
+)
+TOKEN = re.compile(rb"(?:" + b"|".join(map(re.escape, PATCHES)) + rb")\b")
+ENTRY_ARM = re.compile(
+    rb"^( *)NodeCategory::Entry => ([^\n]*)\n\1NodeCategory::Durable => [^\n]*\n", re.M
+)
+
+
+def add_state_arm(arm):
+    indent, entry_value = arm.group(1), arm.group(2)
+    state_value = entry_value.replace(ENTRY_TONE, STATE_TONE)
+    return arm.group(0) + indent + STATE_ARM + state_value + b"\n"
+
+
+def rewrite_block(match):
+    block = match.group(0)
+    for old, new in ARM_PATCHES:
+        block = block.replace(old, new)
+    return ENTRY_ARM.sub(add_state_arm, block, count=1)
+
+
+def rewrite(content):
+    return sub_anchored(content, BLOCK, BLOCK_ANCHOR, rewrite_block)
+
+
+def already_migrated(path):
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return True
+        with mmap.mmap(fd, min(HEADER_BYTES, size), prot=mmap.PROT_READ) as header:
+            return header.find(MIGRATED_MARKER) != -1 and TOKEN.search(header) is None
+    finally:
+        os.close(fd)
+
+
+def apply_rename(path):
+    if already_migrated(path):
+        return False
+    return patch_mapped(path, BLOCK, rewrite_block, anchor=BLOCK_ANCHOR)
+
+
+def run():
+    apply_rename(TARGET)
+
+
+if __name__ == "__main__":
+    run()